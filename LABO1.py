@@ -1,25 +1,64 @@
 import math
-from typing import Union
+from typing import List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy нужен только для пакетных операций
+    np = None
+
+TWO_PI = 2 * math.pi
 
 
 def normalize(radians: float) -> float:
     """Нормализовать угол в диапазон [0, 2π)"""
-    two_pi = 2 * math.pi
-    normalized = radians % two_pi
-    if normalized < 0:
-        normalized += two_pi
-    return normalized
+    # Остаток от деления на положительный делитель уже неотрицателен
+    return radians % TWO_PI
+
+
+def _require_numpy() -> None:
+    """Проверить, что NumPy доступен для пакетных операций"""
+    if np is None:
+        raise ImportError("Для пакетных операций требуется NumPy")
+
+
+def normalize_array(radians) -> 'np.ndarray':
+    """Нормализовать массив углов (в радианах) в диапазон [0, 2π)"""
+    _require_numpy()
+    return np.mod(np.asarray(radians, dtype=np.float64), TWO_PI)
 
 
 class Angle:
     """Класс для хранения и работы с углами"""
+    __slots__ = ('_radians', '_normalized')
+
     def __init__(self, radians: float) -> None:
         self._radians = radians
+        self._normalized: Optional[float] = None
+
+    @classmethod
+    def _new(cls, radians: float) -> 'Angle':
+        """Создать угол без вызова __init__ (для результатов арифметики)"""
+        obj = object.__new__(cls)
+        obj._radians = radians
+        obj._normalized = None
+        return obj
 
     @classmethod
     def from_degrees(cls, degrees: int) -> 'Angle':
         return cls(math.radians(degrees))
 
+    @classmethod
+    def from_array(cls, radians) -> List['Angle']:
+        """Создать список углов из массива радиан"""
+        _require_numpy()
+        return [cls(float(value)) for value in np.asarray(radians, dtype=np.float64).ravel()]
+
+    @staticmethod
+    def to_array(angles: Sequence['Angle']) -> 'np.ndarray':
+        """Преобразовать последовательность углов в массив радиан"""
+        _require_numpy()
+        return np.fromiter((angle._radians for angle in angles), dtype=np.float64, count=len(angles))
+
     @property
     def radians(self) -> float:
         """Получить угол в радианах"""
@@ -29,6 +68,7 @@ class Angle:
     def radians(self, value: float) -> None:
         """Установить угол в радианах"""
         self._radians = value
+        self._normalized = None
 
     @property
     def degrees(self) -> float:
@@ -39,6 +79,13 @@ class Angle:
     def degrees(self, value: float) -> None :
         """Установить угол в градусах"""
         self._radians = math.radians(value)
+        self._normalized = None
+
+    def _norm(self) -> float:
+        """Нормализованный угол в радианах (вычисляется один раз)"""
+        if self._normalized is None:
+            self._normalized = normalize(self._radians)
+        return self._normalized
 
     def __float__(self) -> float:
         """Преобразование в float (в радианах)"""
@@ -58,27 +105,31 @@ class Angle:
 
     def __eq__(self, other) -> bool:
         """Сравнение на равенство"""
-        if isinstance(other, (int, float)):
+        # Сначала проверяем точный тип, isinstance нужен только для подклассов
+        t = type(other)
+        if t is float or t is int or (t is not Angle and isinstance(other, (int, float))):
             other = Angle(other)
-        if isinstance(other, Angle):
-            return abs(normalize(self._radians) - normalize(other._radians)) < 1e-10
-        return NotImplemented
+        elif t is not Angle and not isinstance(other, Angle):
+            return NotImplemented
+        return abs(self._norm() - other._norm()) < 1e-10
 
     def __lt__(self, other) -> bool:
         """Меньше"""
-        if isinstance(other, (int, float)):
+        t = type(other)
+        if t is float or t is int or (t is not Angle and isinstance(other, (int, float))):
             other = Angle(other)
-        if isinstance(other, Angle):
-            return normalize(self._radians) < normalize(other._radians)
-        return NotImplemented
+        elif t is not Angle and not isinstance(other, Angle):
+            return NotImplemented
+        return self._norm() < other._norm()
 
     def __le__(self, other) -> bool:
         """Меньше или равно"""
-        if isinstance(other, (int, float)):
+        t = type(other)
+        if t is float or t is int or (t is not Angle and isinstance(other, (int, float))):
             other = Angle(other)
-        if isinstance(other, Angle):
-            return normalize(self._radians) <= normalize(other._radians)
-        return NotImplemented
+        elif t is not Angle and not isinstance(other, Angle):
+            return NotImplemented
+        return self._norm() <= other._norm()
 
     def __gt__(self, other) -> bool:
         """Больше"""
@@ -90,10 +141,11 @@ class Angle:
 
     def __add__(self, other) -> 'Angle':
         """Сложение"""
-        if isinstance(other, (int, float)):
-            return Angle(self._radians + other)
-        if isinstance(other, Angle):
-            return Angle(self._radians + other._radians)
+        t = type(other)
+        if t is float or t is int or (t is not Angle and isinstance(other, (int, float))):
+            return Angle._new(self._radians + other)
+        if t is Angle or isinstance(other, Angle):
+            return Angle._new(self._radians + other._radians)
         return NotImplemented
 
     def __radd__(self, other) -> 'Angle':
@@ -102,22 +154,25 @@ class Angle:
 
     def __sub__(self, other) -> 'Angle':
         """Вычитание"""
-        if isinstance(other, (int, float)):
-            return Angle(self._radians - other)
-        if isinstance(other, Angle):
-            return Angle(self._radians - other._radians)
+        t = type(other)
+        if t is float or t is int or (t is not Angle and isinstance(other, (int, float))):
+            return Angle._new(self._radians - other)
+        if t is Angle or isinstance(other, Angle):
+            return Angle._new(self._radians - other._radians)
         return NotImplemented
 
     def __rsub__(self, other: Union['Angle', float]):
         """Правое вычитание"""
-        if isinstance(other, (int, float)):
-            return Angle(other - self._radians)
+        t = type(other)
+        if t is float or t is int or isinstance(other, (int, float)):
+            return Angle._new(other - self._radians)
         return NotImplemented
 
     def __mul__(self, scalar: float) -> 'Angle':
         """Умножение на число"""
-        if isinstance(scalar, (int, float)):
-            return Angle(self._radians * scalar)
+        t = type(scalar)
+        if t is float or t is int or isinstance(scalar, (int, float)):
+            return Angle._new(self._radians * scalar)
         return NotImplemented
 
     def __rmul__(self, scalar: float) -> 'Angle':
@@ -126,15 +181,16 @@ class Angle:
 
     def __truediv__(self, scalar: float) -> 'Angle':
         """Деление на число"""
-        if isinstance(scalar, (int, float)):
+        t = type(scalar)
+        if t is float or t is int or isinstance(scalar, (int, float)):
             if scalar == 0:
                 raise ZeroDivisionError("Division by zero")
-            return Angle(self._radians / scalar)
+            return Angle._new(self._radians / scalar)
         return NotImplemented
 
     def __abs__(self) -> 'Angle':
         """Абсолютное значение"""
-        return Angle(abs(self._radians))
+        return Angle._new(abs(self._radians))
 
 
 def to_angle(value: Angle) -> Angle:
@@ -149,12 +205,16 @@ def to_angle(value: Angle) -> Angle:
 
 class AngleRange:
     """Класс для хранения промежутков углов"""
+    __slots__ = ('start', 'end', 'start_inclusive', 'end_inclusive',
+                 '_start_raw', '_end_raw', '_start_n', '_end_n', '_wrap')
+
     def __init__(self, start: Union[int, float, Angle], end: Union[int, float, Angle], start_inclusive=True, end_inclusive=True) -> None:
 
         self.start = to_angle(start)
         self.end = to_angle(end)
         self.start_inclusive = start_inclusive
         self.end_inclusive = end_inclusive
+        self._refresh()
 
     @classmethod
     def from_degrees(cls, start_deg: int, end_deg: int, start_inclusive=True, end_inclusive=True) -> 'AngleRange':
@@ -182,9 +242,24 @@ class AngleRange:
         return (f"AngleRange(start={self.start!r}, end={self.end!r}, "
                 f"start_inclusive={self.start_inclusive}, end_inclusive={self.end_inclusive})")
 
+    def _refresh(self) -> None:
+        """Пересчитать нормализованные границы по текущим углам start/end"""
+        self._start_raw = self.start._radians
+        self._end_raw = self.end._radians
+        self._start_n = self.start._norm()
+        self._end_n = self.end._norm()
+        self._wrap = self._start_n > self._end_n
+
+    def _bounds(self) -> Tuple[float, float, bool]:
+        """Нормализованные границы и признак перехода через 0.
+        Углы изменяемы, а start/end можно переприсвоить - кэш проверяется по радианам"""
+        if self.start._radians != self._start_raw or self.end._radians != self._end_raw:
+            self._refresh()
+        return self._start_n, self._end_n, self._wrap
+
     def __abs__(self) -> Angle:
         """Длина промежутка"""
-        if self.start <= self.end:
+        if not self._bounds()[2]:
             return Angle(self.end.radians - self.start.radians)
 
         # Промежуток проходит через 0
@@ -201,21 +276,43 @@ class AngleRange:
 
     def _contains_angle(self, angle: Angle) -> bool:
         """Проверка принадлежности угла"""
-        if self.start <= self.end:
+        value = angle._norm()
+        start, end, wrap = self._bounds()
+
+        left_ok = value > start or (self.start_inclusive and abs(value - start) < 1e-10)
+        right_ok = value < end or (self.end_inclusive and abs(value - end) < 1e-10)
+        if not wrap:
             # Обычный промежуток
-            left_ok = (angle > self.start) or (angle == self.start and self.start_inclusive)
-            right_ok = (angle < self.end) or (angle == self.end and self.end_inclusive)
             return left_ok and right_ok
 
         # Промежуток проходит через 0
-        left_ok = (angle > self.start) or (angle == self.start and self.start_inclusive)
-        right_ok = (angle < self.end) or (angle == self.end and self.end_inclusive)
         return left_ok or right_ok
 
+    def contains_array(self, radians) -> 'np.ndarray':
+        """Пакетная проверка принадлежности углов (в радианах), возвращает булеву маску"""
+        angles = normalize_array(radians)
+        start, end, wrap = self._bounds()
+
+        left_ok = angles > start
+        if self.start_inclusive:
+            left_ok |= np.abs(angles - start) < 1e-10
+        right_ok = angles < end
+        if self.end_inclusive:
+            right_ok |= np.abs(angles - end) < 1e-10
+
+        if not wrap:
+            # Обычный промежуток
+            return left_ok & right_ok
+
+        # Промежуток проходит через 0
+        return left_ok | right_ok
+
     def _contains_range(self, other: 'AngleRange') -> bool:
         """Проверка вхождения промежутка в другой"""
         # Упрощенная проверка - точное совпадение границ
-        return (self.start <= other.start and self.end >= other.end and
+        start, end, _ = self._bounds()
+        other_start, other_end, _ = other._bounds()
+        return (start <= other_start and end >= other_end and
                 (not other.start_inclusive or self.start_inclusive) and
                 (not other.end_inclusive or self.end_inclusive))
 
@@ -239,40 +336,83 @@ class AngleRange:
 
         return f"{self} ∪ {other}"
 
-    def __sub__(self, other: 'AngleRange') -> str:
-        """Разность промежутков"""
+    def __sub__(self, other: 'AngleRange') -> List['AngleRange']:
+        """Разность промежутков (отдельные точки - вырожденные промежутки)"""
         if not isinstance(other, AngleRange):
             return NotImplemented
         if (self.start_inclusive and not other.start_inclusive) and \
                 (self.end_inclusive and not other.end_inclusive) and self._intersects(other):
-            return f'{self.start} ∪ {self.end}'
+            return [AngleRange(self.start, self.start), AngleRange(self.end, self.end)]
         elif self.start_inclusive and not other.start_inclusive:
-            return str(self.start)
+            return [AngleRange(self.start, self.start)]
         elif self.end_inclusive and not other.end_inclusive:
-            return str(self.end)
+            return [AngleRange(self.end, self.end)]
         elif self == other:
-            return "∅"
+            return []
         elif self._intersects(other):
-            new_start = min(self.start, other.start)
-            new_end = max(self.end, other.end)
-            if self.end > other.end:
-                return f"{AngleRange(new_start, other.start, start_inclusive=True, end_inclusive=False)} ∪ " \
-                       f"{AngleRange(other.end, new_end, start_inclusive=False, end_inclusive=True)}"
+            # Смещения от начала первого промежутка: он занимает [0, length],
+            # второй - [offset, other_end] и может перейти через 2π
+            start_n, end_n, _ = self._bounds()
+            other_start_n, other_end_n, _ = other._bounds()
+            length = (end_n - start_n) % TWO_PI
+            offset = (other_start_n - start_n) % TWO_PI
+            other_end = offset + (other_end_n - other_start_n) % TWO_PI
+            if other_end >= TWO_PI:
+                # Второй промежуток накрывает начало первого
+                if other_end - TWO_PI >= length:
+                    return []
+                start, start_inclusive = other.end, not other.end_inclusive
+                if other_end - TWO_PI < 1e-10:
+                    # Конец второго совпадает с началом первого - точка остается, только если
+                    # она есть в первом промежутке
+                    start_inclusive = self.start_inclusive and start_inclusive
             else:
-                return "The first corner range should be larger than the second range."
+                start, start_inclusive = self.start, self.start_inclusive
+            if offset > length:
+                return [AngleRange(start, self.end, start_inclusive, self.end_inclusive)]
+
+            result = []
+            if offset > 0:
+                # Начало второго может совпасть с концом первого - тогда точка не добавляется
+                end_inclusive = not other.start_inclusive
+                if length - offset < 1e-10:
+                    end_inclusive = self.end_inclusive and end_inclusive
+                result.append(AngleRange(start, other.start, start_inclusive, end_inclusive))
+            if other_end < length:
+                # Конец второго может совпасть с началом первого (вырожденный второй промежуток)
+                start_inclusive = not other.end_inclusive
+                if other_end < 1e-10:
+                    start_inclusive = self.start_inclusive and start_inclusive
+                result.append(AngleRange(other.end, self.end, start_inclusive, self.end_inclusive))
+            return result
         else:
-            return str(self)
+            return [self]
 
 
     def _intersects(self, other: 'AngleRange') -> bool:
         """Проверяет, пересекаются ли промежутки"""
-
-        if self.start <= self.end and other.start <= other.end:
-            return not (self.end < other.start or other.end < self.start)
+        start, end, wrap = self._bounds()
+        other_start, other_end, other_wrap = other._bounds()
+        if not wrap and not other_wrap:
+            return not (end < other_start or other_end < start)
 
         return True
 
 
+def format_ranges(ranges: List[AngleRange]) -> str:
+    """Форматирует список промежутков в строку"""
+    if not ranges:
+        return "∅"
+
+    # Вырожденный замкнутый промежуток [a, a] выводится как точка a
+    return " ∪ ".join(str(r.start) if _is_point(r) else str(r) for r in ranges)
+
+
+def _is_point(r: AngleRange) -> bool:
+    """Промежуток вида [a, a] - одна точка"""
+    return r.start_inclusive and r.end_inclusive and r.start.radians == r.end.radians
+
+
 print("класс Angle")
 
 angle1 = Angle.from_degrees(90)  # 45 градусов
@@ -324,10 +464,10 @@ print(f"{range1} == {range2}: {range1 == range2}\n")
 print(f"{range2} == {range5}: {range2 == range5}\n")
 
 print(f"{range1} + {range2} = {range1 + range2}")
-print(f"{range1} - {range4} = {range1 - range4}")
+print(f"{range1} - {range4} = {format_ranges(range1 - range4)}")
 
-print(f"{range5} - {range2} = {range5 - range2}")
-print(f"{range5} - {range5} = {range5 - range5}")
+print(f"{range5} - {range2} = {format_ranges(range5 - range2)}")
+print(f"{range5} - {range5} = {format_ranges(range5 - range5)}")
 
 #  [Pi / 6, 7 * Pi] in [Pi / 3,  8 * Pi] = True
 
@@ -345,9 +485,25 @@ print(f"{range6} in {range7}: {range6 in range7}\n")
 range6 = AngleRange.from_degrees(10, 50)
 range7 = AngleRange.from_degrees(10, 50, False, False)
 
-print(f"{range6} - {range7} = {range6 - range7}")
+print(f"{range6} - {range7} = {format_ranges(range6 - range7)}")
 
 range6 = AngleRange(math.pi / 3, math.pi, False, False)
 range7 = AngleRange(math.pi / 2, 7 * math.pi / 6)
 
 print(f"{range6} + {range7} = {range6 + range7}")
+
+# Границы совпадают: точка 15° не входит в уменьшаемое, поэтому не входит и в разность
+range8 = AngleRange.from_degrees(15, 133, False, False)
+range9 = AngleRange.from_degrees(126, 15, False, False)
+
+print(f"{range8} - {range9} = {format_ranges(range8 - range9)}")
+
+if np is not None:
+    print("\nпакетные операции (NumPy)")
+
+    batch = np.radians([0, 45, 90, 180, 400])
+    batch_angles = Angle.from_array(batch)
+
+    print(f"Angle.from_array: {', '.join(str(angle) for angle in batch_angles)}")
+    print(f"Angle.to_array: {np.round(Angle.to_array(batch_angles), 4)}")
+    print(f"{range1}.contains_array: {range1.contains_array(batch)}")
@@ -1,19 +1,26 @@
 import re
+import atexit
 import datetime
+import io
 import socket
 import ftplib
 import sys
-from enum import Enum
-from typing import List, Protocol
+import time
+from enum import IntEnum
+from typing import Iterable, List, Protocol
 
 
 # 1. Перечислитель LogLevel
-class LogLevel(Enum):
+class LogLevel(IntEnum):
     INFO = 1
     WARN = 2
     ERROR = 3
 
 
+# Готовые метки уровней для форматирования
+_LEVEL_TAG = {level: f'[{level.name}]' for level in LogLevel}
+
+
 # 2. протокол фильтров
 class LogFilterProtocol(Protocol):
     def match(self, log_level: LogLevel, text: str) -> bool:
@@ -24,17 +31,47 @@ class LogFilterProtocol(Protocol):
 class SimpleLogFilter:
     """ для фильтрации по вхождению паттерна,
      задаваемого текстом, в текст сообщения"""
+    __slots__ = ('pattern', '_re')
 
     def __init__(self, pattern: str):
         self.pattern = pattern.lower()
+        # Поиск без учета регистра без создания копии text.lower()
+        self._re = re.compile(re.escape(self.pattern), re.IGNORECASE)
+
+    def match(self, log_level: LogLevel, text: str) -> bool:
+        return self._re.search(text) is not None
+
+
+class CompositeSimpleFilter:
+    """для фильтрации по вхождению сразу нескольких паттернов,
+     задаваемых текстом, в текст сообщения одним регулярным выражением"""
+    __slots__ = ('patterns', '_re')
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = [pattern.lower() for pattern in patterns]
+        self._re = self._compile([re.escape(pattern) for pattern in self.patterns])
+
+    @classmethod
+    def from_filters(cls, filters: List[SimpleLogFilter]) -> 'CompositeSimpleFilter':
+        composite = cls.__new__(cls)
+        composite.patterns = [f.pattern for f in filters]
+        composite._re = cls._compile([f._re.pattern for f in filters])
+        return composite
+
+    @staticmethod
+    def _compile(sources: List[str]) -> re.Pattern:
+        # Каждый паттерн - опережающая проверка, поэтому должны совпасть все,
+        # как и при последовательной проверке отдельных фильтров
+        return re.compile(''.join(f'(?=.*?{source})' for source in sources), re.IGNORECASE | re.DOTALL)
 
     def match(self, log_level: LogLevel, text: str) -> bool:
-        return self.pattern in text.lower()
+        return self._re.match(text) is not None
 
 
 class ReLogFilter:
     """для фильтрации по вхождению паттерна,
      задаваемого регулярным выражением, в текст сообщения"""
+    __slots__ = ('pattern',)
 
     def __init__(self, pattern: str):
         try:
@@ -48,12 +85,13 @@ class ReLogFilter:
 
 class LevelFilter:
     """Для фильтрации по LogLevel"""
+    __slots__ = ('min_level',)
 
     def __init__(self, min_level: LogLevel):
         self.min_level = min_level
 
     def match(self, log_level: LogLevel, text: str) -> bool:
-        return log_level.value >= self.min_level.value
+        return log_level >= self.min_level
 
 
 # 4. Протокол обработчиков
@@ -65,13 +103,15 @@ class LogHandlerProtocol(Protocol):
 # 5. Классы обработчиков
 class FileHandler:
     """Запись логов в файл"""
+    __slots__ = ('filename', '_fp')
 
     def __init__(self, filename: str):
+        self._fp = None
         try:
-            # Проверяем возможность записи в файл
-            with open(filename, 'a', encoding='utf-8') as f:
-                f.write('')  # тестовая запись
+            # Файл открывается один раз и остается открытым до close()
+            self._fp = open(filename, 'a', encoding='utf-8', buffering=1 << 16)
             self.filename = filename
+            atexit.register(self.close)
         except PermissionError as e:
             print(f"Ошибка доступа к файлу '{filename}': {e}")
             self.filename = None
@@ -82,14 +122,20 @@ class FileHandler:
             print(f"Неожиданная ошибка при инициализации FileHandler: {e}")
             self.filename = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
     def handle(self, log_level: LogLevel, text: str) -> None:
-        if self.filename is None:
+        if self._fp is None:
             print(f"FileHandler: невозможно записать в файл - {text}")
             return
 
         try:
-            with open(self.filename, 'a', encoding='utf-8') as f:
-                f.write(text + '\n')
+            self._fp.write(text)
+            self._fp.write('\n')
         except PermissionError as e:
             print(f"Ошибка доступа при записи в '{self.filename}': {e}")
         except OSError as e:
@@ -97,69 +143,124 @@ class FileHandler:
         except Exception as e:
             print(f"Неожиданная ошибка при записи в файл: {e}")
 
+    def flush(self) -> None:
+        """Сбросить буфер записи на диск"""
+        if self._fp is not None:
+            self._fp.flush()
+
+    def close(self) -> None:
+        """Закрыть файл (вызывается автоматически при завершении программы)"""
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+            atexit.unregister(self.close)
+
 
 class SocketHandler:
     """Отправка логов через сокет"""
+    __slots__ = ('host', 'port', '_sock')
 
     def __init__(self, host: str, port: int):
         self.host = host
         self.port = port
+        self._sock = None  # соединение открывается при первой записи
+
+    def _connect(self) -> socket.socket:
+        sock = socket.create_connection((self.host, self.port))
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self._sock = sock
+        return sock
 
     def handle(self, log_level: LogLevel, text: str) -> None:
+        data = f"{text}\n".encode('utf-8')
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.connect((self.host, self.port))
-                s.sendall(f"{text}\n".encode('utf-8'))
+            try:
+                (self._sock or self._connect()).sendall(data)
+            except OSError:
+                # Соединение могло быть разорвано - переподключаемся один раз
+                self.close()
+                self._connect().sendall(data)
         except Exception as e:
+            self.close()
             print(f"Socket error: {e}")
 
+    def close(self) -> None:
+        """Закрыть соединение"""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+_CONSOLE_PREFIX = {
+    LogLevel.INFO: '\033[94m',  # синий
+    LogLevel.WARN: '\033[93m',  # желтый
+    LogLevel.ERROR: '\033[91m'  # красный
+}
+_RESET = '\033[0m'
+
 
 class ConsoleHandler:
     """Вывод логов в консоль"""
+    __slots__ = ()
+
     @staticmethod
     def handle(log_level: LogLevel, text: str) -> None:
-        colors = {
-            LogLevel.INFO: '\033[94m',  # синий
-            LogLevel.WARN: '\033[93m',  # желтый
-            LogLevel.ERROR: '\033[91m'  # красный
-        }
-        reset = '\033[0m'
-        print(f"{colors[log_level]}{text}{reset}")
+        sys.stdout.write(_CONSOLE_PREFIX[log_level] + text + _RESET + '\n')
 
 
 class SyslogHandler:
     """Запись в системные логи"""
+    __slots__ = ()
+
     @staticmethod
     def handle(log_level: LogLevel, text: str) -> None:
         # Принудительный вывод с форматированием и сбросом буфера
         timestamp = datetime.datetime.now().strftime('%Y.%m.%d %H:%M:%S')
-        formatted_message = f"SYSLOG [{log_level.name}] [{timestamp}] {text}"
+        formatted_message = f"SYSLOG {_LEVEL_TAG[log_level]} [{timestamp}] {text}"
         print(formatted_message, file=sys.stderr)
         sys.stderr.flush()
 
 
 class FtpHandler:
     """Запись логов на FTP сервер"""
+    __slots__ = ('host', 'username', 'password', 'remote_path', '_ftp')
+
     def __init__(self, host: str, username: str, password: str, remote_path: str):
         self.host = host
         self.username = username
         self.password = password
         self.remote_path = remote_path
+        self._ftp = None  # сессия открывается при первой записи
+
+    def _connect(self) -> ftplib.FTP:
+        ftp = ftplib.FTP(self.host)
+        ftp.login(self.username, self.password)
+        self._ftp = ftp
+        return ftp
 
     def handle(self, log_level: LogLevel, text: str) -> None:
+        # Запись дописывается в файл на FTP прямо из памяти, без временного файла
+        data = (text + '\n').encode('utf-8')
         try:
-            with ftplib.FTP(self.host) as ftp:
-                ftp.login(self.username, self.password)
-                # Упрощенная реализация - добавляем в файл на FTP
-                temp_file = f"temp_log_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-                with open(temp_file, 'w', encoding='utf-8') as f:
-                    f.write(text + '\n')
-
-                with open(temp_file, 'rb') as f:
-                    ftp.storbinary(f"{self.remote_path}", f)
+            try:
+                (self._ftp or self._connect()).storbinary(f"APPE {self.remote_path}", io.BytesIO(data))
+            except ftplib.all_errors:
+                # Сессия могла быть закрыта сервером - переподключаемся один раз
+                self.close()
+                self._connect().storbinary(f"APPE {self.remote_path}", io.BytesIO(data))
         except Exception as e:
+            self.close()
             print(f"FTP error: {e}")
 
+    def close(self) -> None:
+        """Завершить FTP сессию"""
+        if self._ftp is not None:
+            try:
+                self._ftp.quit()
+            except ftplib.all_errors:
+                self._ftp.close()
+            self._ftp = None
+
 
 # 6. Протокол для форматтеров
 class LogFormatterProtocol(Protocol):
@@ -170,13 +271,27 @@ class LogFormatterProtocol(Protocol):
 # 7. Класс форматтера
 class StandardFormatter:
     """Форматтер с добавлением уровня и времени"""
+    __slots__ = ('time_format', '_last_ts_int', '_last_ts_str')
 
     def __init__(self, time_format: str = '%Y.%m.%d %H:%M:%S'):
         self.time_format = time_format
+        # Кэш отформатированного времени для текущей секунды
+        self._last_ts_int = -1
+        self._last_ts_str = ''
+
+    def _timestamp(self) -> str:
+        if '%f' in self.time_format:
+            # Микросекунды меняются каждый вызов - кэшировать нечего
+            return datetime.datetime.now().strftime(self.time_format)
+
+        sec = int(time.time())
+        if sec != self._last_ts_int:
+            self._last_ts_str = time.strftime(self.time_format, time.localtime(sec))
+            self._last_ts_int = sec
+        return self._last_ts_str
 
     def format(self, log_level: LogLevel, text: str) -> str:
-        timestamp = datetime.datetime.now().strftime(self.time_format)
-        return f"[{log_level.name}] [{timestamp}] {text}"
+        return f"{_LEVEL_TAG[log_level]} [{self._timestamp()}] {text}"
 
 
 # 8. Основной класс Logger
@@ -185,16 +300,59 @@ class Logger:
                  filters: List[LogFilterProtocol],
                  formatters: List[LogFormatterProtocol],
                  handlers: List[LogHandlerProtocol]):
+        """Набор фильтров запоминается при создании (копией списка): чтобы изменить его,
+        присвойте logger.filters новый список - изменения исходного или возвращенного
+        списка на месте не учитываются. Порог LevelFilter читается при каждом вызове log"""
         self.filters = filters
         self.formatters = formatters
         self.handlers = handlers
 
+    @property
+    def filters(self) -> List[LogFilterProtocol]:
+        """Фильтры в исходном порядке (копия)"""
+        return list(self._filters)
+
+    @filters.setter
+    def filters(self, filters: Iterable[LogFilterProtocol]) -> None:
+        self._filters = list(filters)
+
+        # Дешевые проверки уровня выполняются первыми; подклассы LevelFilter
+        # могут переопределять match, поэтому проверяются вместе с остальными фильтрами
+        self._level_filters = tuple(f for f in self._filters if type(f) is LevelFilter)
+        self._text_filters = self.compile_filters([f for f in self._filters if type(f) is not LevelFilter])
+
+    @staticmethod
+    def compile_filters(filters: List[LogFilterProtocol]) -> List[LogFilterProtocol]:
+        """Объединить соседние SimpleLogFilter в один CompositeSimpleFilter"""
+        compiled = []
+        group = []
+        for filter_obj in filters + [None]:
+            if type(filter_obj) is SimpleLogFilter:
+                group.append(filter_obj)
+                continue
+            if len(group) > 1:
+                compiled.append(CompositeSimpleFilter.from_filters(group))
+            else:
+                compiled.extend(group)
+            group = []
+            if filter_obj is not None:
+                compiled.append(filter_obj)
+        return compiled
+
     def log(self, log_level: LogLevel, text: str) -> None:
+        for level_filter in self._level_filters:
+            if log_level < level_filter.min_level:
+                return  # Сообщение не прошло фильтр по уровню
+
         # Применяем фильтры
-        for filter_obj in self.filters:
+        for filter_obj in self._text_filters:
             if not filter_obj.match(log_level, text):
                 return  # Сообщение не прошло фильтр
 
+        # Без обработчиков форматировать незачем
+        if not self.handlers:
+            return
+
         # Применяем форматтеры
         formatted_text = text
         for formatter in self.formatters:
@@ -316,6 +474,7 @@ def verify_file_output():
     for level, message in test_messages:
         formatted = StandardFormatter().format(level, message)
         file_handler.handle(level, formatted)
+    file_handler.flush()
 
     # Читаем и проверяем
     try:
@@ -336,6 +495,8 @@ def automated_test():
         "LevelFilter": False,
         "SimpleFilter": False,
         "RegexFilter": False,
+        "CompositeFilter": False,
+        "CompileFilters": False,
         "Formatter": False,
         "FalseHandler": False
     }
@@ -362,6 +523,26 @@ def automated_test():
             not regex_filter.match(LogLevel.INFO, "error text")
     )
 
+    # Тест CompositeSimpleFilter: должны совпасть все паттерны, в любом порядке
+    composite_filter = CompositeSimpleFilter(["error", "disk"])
+    test_results["CompositeFilter"] = (
+            composite_filter.match(LogLevel.INFO, "Disk ERROR") and
+            not composite_filter.match(LogLevel.INFO, "error only") and
+            not composite_filter.match(LogLevel.INFO, "disk only")
+    )
+
+    # Тест compile_filters: соседние SimpleLogFilter сворачиваются в один
+    compiled = Logger.compile_filters([SimpleLogFilter("error"), SimpleLogFilter("disk"),
+                                       regex_filter, SimpleLogFilter("secret")])
+    test_results["CompileFilters"] = (
+            len(compiled) == 3 and
+            type(compiled[0]) is CompositeSimpleFilter and
+            compiled[1] is regex_filter and
+            type(compiled[2]) is SimpleLogFilter and
+            compiled[0].match(LogLevel.INFO, "disk error") and
+            not compiled[0].match(LogLevel.INFO, "disk full")
+    )
+
     # Тест Formatter
     formatter = StandardFormatter()
     formatted = formatter.format(LogLevel.ERROR, "test")
@@ -1,4 +1,5 @@
 import json
+import sys
 from enum import Enum
 from typing import Dict, List, Optional, ClassVar
 
@@ -31,6 +32,10 @@ class ANSI:
         return f'\033[{color.value}m'
 
 
+# Префиксы цветов считаются один раз при импорте
+_COLOR_PREFIX: Dict[Color, str] = {color: ANSI.set_color(color) for color in Color}
+
+
 class FontLoader:
     @staticmethod
     def load_font(filename: str) -> Dict[str, List[str]]:
@@ -44,6 +49,8 @@ class FontLoader:
 class Printer:
     _current_font: ClassVar[Optional[Dict[str, List[str]]]] = None
     _font_height: ClassVar[int] = 0
+    # Таблицы замены '*' на символ заливки
+    _translations: ClassVar[Dict[str, Dict[int, str]]] = {}
 
     def __init__(self, color: Color = Color.WHITE, symbol: str = '*', font_file: str = None):
         self.color = color
@@ -60,28 +67,37 @@ class Printer:
 
     @classmethod
     def load_font(cls, font_file: str) -> None:
-        cls._current_font = FontLoader.load_font(font_file)
-        if cls._current_font:
-            first_char = next(iter(cls._current_font.values()))
+        font = FontLoader.load_font(font_file)
+        if font:
+            first_char = next(iter(font.values()))
             cls._font_height = len(first_char)
+            # Выравнивание строк символов делается один раз при загрузке
+            font = {char: [line.center(cls._font_height) for line in lines] for char, lines in font.items()}
+        cls._current_font = font
 
     @classmethod
-    def print(cls, text: str, color: Color = Color.WHITE, symbol: str = '*') -> None:
+    def _translation(cls, symbol: str) -> Dict[int, str]:
+        table = cls._translations.get(symbol)
+        if table is None:
+            table = cls._translations[symbol] = str.maketrans({'*': symbol})
+        return table
 
-        lines = [''] * cls._font_height
-
-        for char in text.upper():
+    @classmethod
+    def print(cls, text: str, color: Color = Color.WHITE, symbol: str = '*') -> None:
 
-            if char in cls._current_font:
-                char_pattern = cls._current_font[char]
+        font = cls._current_font
+        glyphs = [font[char] for char in text.upper() if char in font]
 
-                for i, line in enumerate(char_pattern):
-                    rendered_line = line.replace('*', symbol)
-                    padded_line = rendered_line.center(cls._font_height)
-                    lines[i] += padded_line + ' '
+        if glyphs:
+            # Строки символов склеиваются построчно, '*' заменяется одним вызовом translate
+            rows = '\n'.join(' '.join(row) + ' ' for row in zip(*glyphs))
+            rows = rows.translate(cls._translation(symbol))
+        else:
+            rows = '\n' * (cls._font_height - 1)
 
-        for line in lines:
-            print(ANSI.set_color(color) + line + ANSI.RESET)
+        # Все строки выводятся одной записью с одним цветовым префиксом
+        if cls._font_height:
+            sys.stdout.write(_COLOR_PREFIX[color] + rows + ANSI.RESET + '\n')
 
     def print_text(self, text: str) -> None:
         self.__class__.print(text, self.color, self.symbol)
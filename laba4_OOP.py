@@ -1,8 +1,44 @@
-from typing import Protocol, TypeVar, Any, Generic
+import atexit
+import sys
+import weakref
+from enum import IntEnum
+from typing import Protocol, TypeVar, Any, Generic, List
 
 # Generic тип для аргументов события
 TEventArgs = TypeVar('TEventArgs')
 
+# Имена свойств интернируются, чтобы сравнивать их по идентичности (is)
+_intern = sys.intern
+
+# Буфер сообщений обработчиков и свойств; выводится пачкой через flush_log()
+_LOG: List[str] = []
+_LOG_ENABLED = True
+
+
+def _log(msg: str) -> None:
+    """Добавить сообщение в буфер (если логирование включено)"""
+    if _LOG_ENABLED:
+        _LOG.append(msg)
+
+
+def flush_log() -> None:
+    """Вывести накопленные сообщения одной записью и очистить буфер"""
+    if _LOG:
+        sys.stdout.write('\n'.join(_LOG) + '\n')
+        _LOG.clear()
+
+
+# Сообщения, которые не успели вывести (например, после прямого вызова invoke), выводятся при выходе
+atexit.register(flush_log)
+
+
+def set_log_enabled(enabled: bool) -> None:
+    """Включить или отключить вывод сообщений обработчиков и свойств"""
+    global _LOG_ENABLED
+    _LOG_ENABLED = enabled
+    if not enabled:
+        _LOG.clear()
+
 
 class EventHandler(Protocol[TEventArgs]):
     """Протокол для обработчиков событий"""
@@ -17,31 +53,149 @@ class EventHandler(Protocol[TEventArgs]):
         ...
 
 
+class _StrongRef:
+    """Сильная ссылка с интерфейсом weakref.ref: вызов возвращает объект"""
+    __slots__ = ('_obj',)
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __call__(self):
+        return self._obj
+
+
 class Event(Generic[TEventArgs]):
+    """Событие. Наблюдатели хранятся по слабым ссылкам и отписываются сами, когда
+    на них не остается других ссылок; keepalive() подписывает с сильной ссылкой"""
+    __slots__ = ('_observers', '_handlers', '_names', '__weakref__')
+
+    # Во время выполнения Event[...] - сам класс, без создания typing-псевдонима;
+    # проверка типов по-прежнему видит Event как Generic
+    def __class_getitem__(cls, item):
+        return cls
 
     def __init__(self):
-        self._observers = []
+        # Словари не изменяются на месте: подписка и отписка подменяют их копией,
+        # поэтому invoke обходит их без снимка, даже если обработчик (от)пишется сам
+        # Ссылки на наблюдателей по id() - без вызова __eq__
+        self._observers = {}
+        # Ссылки на методы handle тех же наблюдателей, получаются один раз при подписке
+        self._handlers = {}
+        # Имена наблюдателей для сообщений об ошибках, определяются при подписке
+        self._names = {}
 
     def __iadd__(self, observer):
-        self._observers.append(observer)
+        """Подписать наблюдателя по слабой ссылке. Наблюдатель должен жить где-то еще:
+        временный объект (event += Handler()) сразу удаляется и отписывается,
+        для него используйте event.keepalive(Handler())"""
+        self._subscribe(observer, strong=False)
         return self
 
     def __isub__(self, observer):
-        if observer in self._observers:
-            self._observers.remove(observer)
+        self._remove(id(observer))
         return self
 
+    def keepalive(self, observer):
+        """Подписать наблюдателя, удерживая его сильной ссылкой (например, временный объект)"""
+        self._subscribe(observer, strong=True)
+        return self
+
+    def _subscribe(self, observer, strong: bool) -> None:
+        key = id(observer)
+        handle = observer.handle
+        if not strong:
+            try:
+                observer_ref = weakref.ref(observer, self._make_forget(key))
+            except TypeError:
+                strong = True  # Объект не поддерживает слабые ссылки
+
+        if strong:
+            observer_ref = _StrongRef(observer)
+            handler_ref = _StrongRef(handle)
+        elif getattr(handle, '__self__', None) is observer:
+            # Связанный метод держал бы наблюдателя - храним WeakMethod
+            handler_ref = weakref.WeakMethod(handle)
+        else:
+            # staticmethod и прочие функции наблюдателя не держат
+            handler_ref = _StrongRef(handle)
+
+        observers = dict(self._observers)
+        observers[key] = observer_ref
+        handlers = dict(self._handlers)
+        handlers[key] = handler_ref
+        names = dict(self._names)
+        names[key] = getattr(observer, 'name', observer.__class__.__name__)
+        self._observers = observers
+        self._handlers = handlers
+        self._names = names
+
+    def _make_forget(self, key: int):
+        """Колбэк слабой ссылки: отписать наблюдателя после его удаления"""
+        event_ref = weakref.ref(self)
+
+        def forget(observer_ref):
+            event = event_ref()
+            if event is not None and event._observers.get(key) is observer_ref:
+                event._remove(key)
+
+        return forget
+
+    def _remove(self, key: int) -> None:
+        if key not in self._observers:
+            return
+        observers = dict(self._observers)
+        del observers[key]
+        handlers = dict(self._handlers)
+        del handlers[key]
+        names = dict(self._names)
+        del names[key]
+        self._observers = observers
+        self._handlers = handlers
+        self._names = names
+
     def invoke(self, sender, args):
-        observers_copy = self._observers[:]
-        for observer in observers_copy:
+        self._dispatch(self._handlers, sender, args)
+
+    def _dispatch(self, handlers, sender, args):
+        """Вызвать обработчики из словаря handlers (id наблюдателя -> ссылка на handle)"""
+        count = len(handlers)
+        if count == 0:
+            return  # Никто не подписан
+
+        # Имена берутся на момент вызова: обработчик может отписаться и затем упасть
+        names = self._names
+        if count == 1:
+            # Один обработчик - вызываем напрямую
+            ((key, handler_ref),) = handlers.items()
+            handler = handler_ref()
+            if handler is not None:
+                try:
+                    handler(sender, args)
+                except Exception as e:
+                    self._report_error(names.get(key, '?'), e)
+            return
+
+        # Один try на весь цикл; после ошибки продолжаем с того же места итератора
+        remaining = iter(handlers.items())
+        while True:
             try:
-                observer.handle(sender, args)
+                for key, handler_ref in remaining:
+                    handler = handler_ref()
+                    if handler is not None:
+                        handler(sender, args)
+                return
             except Exception as e:
-                handler_name = getattr(observer, 'name', observer.__class__.__name__)
-                print(f"Ошибка в обработчике '{handler_name}': {e}")
+                self._report_error(names.get(key, '?'), e)
+
+    @staticmethod
+    def _report_error(handler_name: str, error: Exception) -> None:
+        """Сообщить об ошибке в обработчике (редкий случай)"""
+        print(f"Ошибка в обработчике '{handler_name}': {error}")
 
 
 class TestHandler:
+    __slots__ = ('name', 'received_messages', '__weakref__')
+
     def __init__(self, name):
         self.name = name
         self.received_messages = []
@@ -106,49 +260,58 @@ def test_error_handling():
             print(f"Хороший обработчик получил: {args}")
 
     event = Event[str]()
-    event += ErrorHandler()
-    event += GoodHandler()  # Должен выполниться, даже если первый упал
+    # Временные обработчики - без keepalive их сразу удалил бы сборщик мусора
+    event.keepalive(ErrorHandler())
+    event.keepalive(GoodHandler())  # Должен выполниться, даже если первый упал
 
     print("Тест: вызов события с 'падающим' обработчиком...")
     event.invoke("Тест", "Сообщение")  # Не должно прервать выполнение
     print("Программа продолжила работу после ошибки в обработчике!")
 
 
-# 3. PropertyChangedEventArgs Хранит информацию об изменении свойства
-class PropertyChangedEventArgs:
-    """Аргументы события после изменения свойства"""
-    def __init__(self, property_name: str):
-        self.property_name = property_name
+# 3. PropertyEventArgs Хранит информацию об изменении свойства
+class PropertyPhase(IntEnum):
+    """Фаза события изменения свойства"""
+    CHANGING = 0  # До изменения, обработчик может отменить его
+    CHANGED = 1   # После изменения
+
+
+# Члены перечисления для горячих путей, без обращения к атрибутам класса
+_CHANGING = PropertyPhase.CHANGING
+_CHANGED = PropertyPhase.CHANGED
+
+
+class PropertyEventArgs:
+    """Аргументы события изменения свойства (до и после изменения)"""
+    __slots__ = ('phase', 'property_name', 'old_value', 'new_value', 'can_change')
+
+    def __init__(self, phase: PropertyPhase, property_name: str, old_value: Any, new_value: Any):
+        self.phase = phase
+        self.property_name = _intern(property_name)
+        self.old_value = old_value
+        self.new_value = new_value
+        self.can_change = True  # По умолчанию разрешаем изменение
 
     def __str__(self):
-        return f"PropertyChangedEventArgs(property='{self.property_name}')"
+        return (f"PropertyEventArgs(phase={self.phase.name}, property='{self.property_name}', "
+                f"old={self.old_value}, new={self.new_value}, can_change={self.can_change})")
 
 
 # 4. ConsoleLoggerHandler - обработчик для вывода в консоль
 class ConsoleLoggerHandler:
     """Обработчик для логирования изменений в консоль"""
+    __slots__ = ('name', '__weakref__')
+    phase = PropertyPhase.CHANGED  # Получает только события после изменения
 
     def __init__(self, name: str = "ConsoleLogger"):
         self.name = name
 
     @staticmethod
-    def handle(sender: Any, args: PropertyChangedEventArgs) -> None:
-        print(f"[ConsoleLogger] Свойство '{args.property_name}' изменено в объекте {sender}")
-
+    def handle(sender: Any, args: PropertyEventArgs) -> None:
+        if not _LOG_ENABLED:
+            return  # Не форматируем сообщение (и str(sender)) впустую
+        _log(f"[ConsoleLogger] Свойство '{args.property_name}' изменено в объекте {sender}")
 
-# 5. PropertyChangingEventArgs
-class PropertyChangingEventArgs:
-    """Аргументы события до изменения свойства"""
-
-    def __init__(self, property_name: str, old_value: Any, new_value: Any):
-        self.property_name = property_name
-        self.old_value = old_value
-        self.new_value = new_value
-        self.can_change = True  # По умолчанию разрешаем изменение
-
-    def __str__(self):
-        return (f"PropertyChangingEventArgs(property='{self.property_name}', old={self.old_value}, "
-                f"new={self.new_value}, "f"can_change={self.can_change})")
 
 # вместо общего валидатора два валидатора для интов и стрингов
 # 6. ValidatorHandler - обработчик-валидатор
@@ -190,45 +353,59 @@ class PropertyChangingEventArgs:
 
 class IntValidatorHandler:
     """Базовый валидатор для целочисленных свойств"""
+    __slots__ = ('name', 'min_value', 'max_value', '_check', '__weakref__')
+    phase = PropertyPhase.CHANGING  # Проверяет значение до изменения
 
     def __init__(self, prop_name: str, min_value: int = 0, max_value: int = 100):
-        self.name = prop_name
+        self.name = _intern(prop_name)
         self.min_value = min_value
         self.max_value = max_value
+        # Проверка собирается один раз: границы попадают в замыкание
+        self._check = self._make_check(prop_name, min_value, max_value)
 
-    def handle(self, sender: Any, args: PropertyChangingEventArgs) -> None:
-        """Обработчик валидации"""
-        # Проверяем, соответствует ли имя свойства нашему валидатору
-        if args.property_name != self.name:
-            return
-
-        # Проверяем, является ли значение числом
-        if not isinstance(args.new_value, (int, float)):
-            print(f"[Validator] {args.property_name} должно быть числом: {args.new_value}")
-            args.can_change = False
-            return
-
-        # Преобразуем к целому числу, если это float
-        value = int(args.new_value)
+    @property
+    def property_name(self) -> str:
+        """Свойство, которое проверяет валидатор (для PropertyEvent)"""
+        return self.name
 
-        # Проверяем минимальное значение
-        if value < self.min_value:
-            print(f"[Validator] {args.property_name} не может быть меньше {self.min_value}: {value}")
-            args.can_change = False
+    @staticmethod
+    def _make_check(name: str, lo: int, hi: int):
+        """Создать функцию проверки значения: True - значение допустимо"""
+        def check(new_value: Any) -> bool:
+            # Проверяем, является ли значение числом: сначала точный тип, bool числом не считаем
+            t = type(new_value)
+            if t is not int and t is not float and (t is bool or not isinstance(new_value, (int, float))):
+                _log(f"[Validator] {name} должно быть числом: {new_value}")
+                return False
+
+            # Преобразуем к целому числу, если это float
+            value = int(new_value)
+            if lo <= value <= hi:
+                _log(f"[Validator] {name} валидация пройдена: {value}")
+                return True
+
+            if value < lo:
+                _log(f"[Validator] {name} не может быть меньше {lo}: {value}")
+            else:
+                _log(f"[Validator] {name} не может быть больше {hi}: {value}")
+            return False
+
+        return check
+
+    def handle(self, sender: Any, args: PropertyEventArgs) -> None:
+        """Обработчик валидации"""
+        # Проверяем, соответствует ли имя свойства нашему валидатору (имена интернированы)
+        if args.property_name is not self.name:
             return
 
-        # Проверяем максимальное значение
-        if value > self.max_value:
-            print(f"[Validator] {args.property_name} не может быть больше {self.max_value}: {value}")
+        if not self._check(args.new_value):
             args.can_change = False
-            return
-
-        # Если все проверки пройдены, можно изменить значение
-        print(f"[Validator] {args.property_name} валидация пройдена: {value}")
 
 
 class StringValidatorHandler:
     """Валидатор для строковых свойств Person и Product"""
+    __slots__ = ('name', 'min_length', 'max_length', '_check', '__weakref__')
+    phase = PropertyPhase.CHANGING  # Проверяет значение до изменения
 
     def __init__(self, prop_name: str, min_length: int = 1, max_length: int = 32):
         """
@@ -237,185 +414,212 @@ class StringValidatorHandler:
             min_length: Минимальная длина строки (по умолчанию 1 - не пустая)
             max_length: Максимальная длина строки (по умолчанию 32)
         """
-        self.name = prop_name
+        self.name = _intern(prop_name)
         self.min_length = min_length
         self.max_length = max_length
+        # Проверка собирается один раз: границы и проверка email попадают в замыкание
+        self._check = self._make_check(prop_name, min_length, max_length)
 
-    def handle(self, sender: Any, args: PropertyChangingEventArgs) -> None:
+    @property
+    def property_name(self) -> str:
+        """Свойство, которое проверяет валидатор (для PropertyEvent)"""
+        return self.name
+
+    @staticmethod
+    def _make_check(name: str, min_length: int, max_length: int):
+        """Создать функцию проверки строки: очищенная строка или None, если значение недопустимо"""
+        is_email = name == "email"
+
+        def check(new_value: Any):
+            # Проверяем, является ли значение строкой
+            if type(new_value) is not str and not isinstance(new_value, str):
+                _log(f"[StringValidator] {name} должно быть строкой: {new_value}")
+                return None
+
+            # Очищаем строку (удаляем пробелы по краям), только если они там есть
+            value = new_value
+            if value and (value[0].isspace() or value[-1].isspace()):
+                value = value.strip()
+            length = len(value)
+
+            # Проверяем минимальную длину (не пустая строка)
+            if length < min_length:
+                _log(f"[StringValidator] {name} не может быть пустым")
+                return None
+
+            # Проверяем максимальную длину
+            if length > max_length:
+                _log(f"[StringValidator] {name} слишком длинное "
+                     f"(максимум {max_length} символов): '{value}'")
+                return None
+
+            # Дополнительные проверки для email
+            if is_email and "@" not in value:
+                _log(f"[StringValidator] Email должен содержать символ '@': '{value}'")
+                return None
+
+            _log(f"[StringValidator] {name} валидация пройдена: '{value}'")
+            return value
+
+        return check
+
+    def handle(self, sender: Any, args: PropertyEventArgs) -> None:
         """Обработчик валидации строк"""
-        # Проверяем, соответствует ли имя свойства нашему валидатору
-        if args.property_name != self.name:
+        # Проверяем, соответствует ли имя свойства нашему валидатору (имена интернированы)
+        if args.property_name is not self.name:
             return
 
-        # Проверяем, является ли значение строкой
-        if not isinstance(args.new_value, str):
-            print(f"[StringValidator] {args.property_name} должно быть строкой: {args.new_value}")
+        value = self._check(args.new_value)
+        if value is None:
             args.can_change = False
-            return
+        else:
+            # Обновляем значение в args (очищенная строка)
+            args.new_value = value
 
-        # Очищаем строку (удаляем пробелы по краям)
-        value = args.new_value.strip()
 
-        # Проверяем минимальную длину (не пустая строка)
-        if len(value) < self.min_length:
-            print(f"[StringValidator] {args.property_name} не может быть пустым")
-            args.can_change = False
-            return
-
-        # Проверяем максимальную длину
-        if len(value) > self.max_length:
-            print(f"[StringValidator] {args.property_name} слишком длинное "
-                  f"(максимум {self.max_length} символов): '{value}'")
-            args.can_change = False
-            return
+class PropertyEvent(Event):
+    """Событие изменения свойства с рассылкой по фазе и имени свойства.
+    Обработчик с атрибутом phase получает события только этой фазы, с атрибутом
+    property_name - только этого свойства; без атрибута - все"""
+    __slots__ = ('_targets', '_routes')
 
-        # Дополнительные проверки для email
-        if args.property_name == "email" and "@" not in value:
-            print(f"[StringValidator] Email должен содержать символ '@': '{value}'")
-            args.can_change = False
-            return
+    def __init__(self):
+        super().__init__()
+        # id наблюдателя -> (phase, property_name), None - любые
+        self._targets = {}
+        # (phase, property_name) -> {id: ссылка на handle}, строится при первом вызове
+        self._routes = {}
+
+    def _subscribe(self, observer, strong: bool) -> None:
+        super()._subscribe(observer, strong)
+        self._targets[id(observer)] = (getattr(observer, 'phase', None),
+                                       getattr(observer, 'property_name', None))
+        self._routes = {}
+
+    def _remove(self, key: int) -> None:
+        super()._remove(key)
+        if self._targets.pop(key, None) is not None:
+            self._routes = {}
 
-        # Если все проверки пройдены, можно изменить значение
-        print(f"[StringValidator] {args.property_name} валидация пройдена: '{value}'")
-        # Обновляем значение в args (очищенная строка)
-        args.new_value = value
+    def invoke(self, sender, args):
+        route = (args.phase, args.property_name)
+        handlers = self._routes.get(route)
+        if handlers is None:
+            handlers = self._build_route(route)
+        self._dispatch(handlers, sender, args)
+
+    def _build_route(self, route):
+        """Отобрать обработчики для фазы и свойства, сохраняя порядок подписки"""
+        phase, name = route
+        targets = self._targets
+        handlers = {}
+        for key, handler_ref in self._handlers.items():
+            target_phase, target_name = targets[key]
+            if (target_phase is None or target_phase == phase) and (target_name is None or target_name == name):
+                handlers[key] = handler_ref
+        self._routes[route] = handlers
+        return handlers
 
 
 # 7. Классы с автообновляющимися свойствами
+class ObservedProperty:
+    """Свойство, уведомляющее об изменении через событие property_event (фазы CHANGING и CHANGED)"""
+    __slots__ = ('name', 'attr', 'changed_message', 'cancelled_message')
+
+    def __init__(self, name: str, changed_message: str, cancelled_message: str):
+        """
+        Args:
+            name: Имя свойства (значение хранится в атрибуте '_' + name)
+            changed_message: Сообщение об изменении, шаблон с полями {old} и {new}
+            cancelled_message: Сообщение об отмене изменения, шаблон с полями {old} и {new}
+        """
+        self.name = _intern(name)
+        self.attr = '_' + name
+        self.changed_message = changed_message
+        self.cancelled_message = cancelled_message
+
+    def __get__(self, obj: Any, objtype: type = None) -> Any:
+        if obj is None:
+            return self
+        return getattr(obj, self.attr)
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        # Атрибуты и метод события читаются один раз за запись
+        attr = self.attr
+        invoke = obj.property_event.invoke
+        old_value = getattr(obj, attr)
+
+        # Событие ДО изменения; аргументы свои у каждой записи, поэтому обработчик
+        # может сам менять свойства, не портя аргументы внешней записи
+        args = PropertyEventArgs(_CHANGING, self.name, old_value, value)
+        invoke(obj, args)
+
+        if args.can_change:
+            setattr(obj, attr, value)
+            obj._str_cache = None  # Сбрасываем кэш __str__ владельца
+            # Событие ПОСЛЕ изменения - те же аргументы в следующей фазе
+            args.phase = _CHANGED
+            invoke(obj, args)
+            if _LOG_ENABLED:
+                _log(self.changed_message.format(old=old_value, new=value))
+        elif _LOG_ENABLED:
+            _log(self.cancelled_message.format(old=old_value, new=value))
+        # Граница события - выводим сообщения обработчиков и сеттера
+        flush_log()
+
+
 class Person:
     """Класс Person с отслеживанием изменений свойств"""
+    __slots__ = ('_name', '_age', '_email', 'property_event', '_str_cache')
+
+    name = ObservedProperty("name", "Имя изменено: '{old}' -> '{new}'",
+                            "Изменение имени отменено: '{old}' -> '{new}'")
+    age = ObservedProperty("age", "Возраст изменен: {old} -> {new}",
+                           "Изменение возраста отменено: {old} -> {new}")
+    email = ObservedProperty("email", "Email изменен: '{old}' -> '{new}'",
+                             "Изменение email отменено: '{old}' -> '{new}'")
 
     def __init__(self, name: str = "", age: int = 0, email: str = ""):
         self._name = name
         self._age = age
         self._email = email
 
-        # События
-        self.property_changing = Event[PropertyChangingEventArgs]()
-        self.property_changed = Event[PropertyChangedEventArgs]()
-
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @name.setter
-    def name(self, value: str) -> None:
-        # Событие ДО изменения
-        changing_args = PropertyChangingEventArgs("name", self._name, value)
-        self.property_changing.invoke(self, changing_args)
-
-        if changing_args.can_change:
-            old_value = self._name
-            self._name = value
-            # Событие ПОСЛЕ изменения
-            self.property_changed.invoke(self, PropertyChangedEventArgs("name"))
-            print(f"Имя изменено: '{old_value}' -> '{self._name}'")
-        else:
-            print(f"Изменение имени отменено: '{self._name}' -> '{value}'")
-
-    @property
-    def age(self) -> int:
-        return self._age
-
-    @age.setter
-    def age(self, value: int) -> None:
-        changing_args = PropertyChangingEventArgs("age", self._age, value)
-        self.property_changing.invoke(self, changing_args)
-
-        if changing_args.can_change:
-            old_value = self._age
-            self._age = value
-            self.property_changed.invoke(self, PropertyChangedEventArgs("age"))
-            print(f"Возраст изменен: {old_value} -> {self._age}")
-        else:
-            print(f"Изменение возраста отменено: {self._age} -> {value}")
-
-    @property
-    def email(self) -> str:
-        return self._email
-
-    @email.setter
-    def email(self, value: str) -> None:
-        changing_args = PropertyChangingEventArgs("email", self._email, value)
-        self.property_changing.invoke(self, changing_args)
-
-        if changing_args.can_change:
-            old_value = self._email
-            self._email = value
-            self.property_changed.invoke(self, PropertyChangedEventArgs("email"))
-            print(f"Email изменен: '{old_value}' -> '{self._email}'")
-        else:
-            print(f"Изменение email отменено: '{self._email}' -> '{value}'")
+        # Событие изменения свойств (обе фазы)
+        self.property_event = PropertyEvent()
+        # Строковое представление, сбрасывается при изменении свойства
+        self._str_cache = None
 
     def __str__(self):
-        return f"Person(name='{self.name}', age={self.age}, email='{self.email}')"
+        if self._str_cache is None:
+            self._str_cache = f"Person(name='{self._name}', age={self._age}, email='{self._email}')"
+        return self._str_cache
 
 
 class Product:
     """Класс Product с отслеживанием изменений свойств"""
+    __slots__ = ('_title', '_price', '_quantity', 'property_event', '_str_cache')
+
+    title = ObservedProperty("title", "Название товара изменено: '{old}' -> '{new}'",
+                             "Изменение названия отменено: '{old}' -> '{new}'")
+    price = ObservedProperty("price", "Цена изменена: {old:.2f} -> {new:.2f}",
+                             "Изменение цены отменено: {old:.2f} -> {new:.2f}")
+    quantity = ObservedProperty("quantity", "Количество изменено: {old} -> {new}",
+                                "Изменение количества отменено: {old} -> {new}")
 
     def __init__(self, title: str = "", price: float = 0.0, quantity: int = 0):
         self._title = title
         self._price = price
         self._quantity = quantity
 
-        # События
-        self.property_changing = Event[PropertyChangingEventArgs]()
-        self.property_changed = Event[PropertyChangedEventArgs]()
-
-    @property
-    def title(self) -> str:
-        return self._title
-
-    @title.setter
-    def title(self, value: str) -> None:
-        changing_args = PropertyChangingEventArgs("title", self._title, value)
-        self.property_changing.invoke(self, changing_args)
-
-        if changing_args.can_change:
-            old_value = self._title
-            self._title = value
-            self.property_changed.invoke(self, PropertyChangedEventArgs("title"))
-            print(f"Название товара изменено: '{old_value}' -> '{self._title}'")
-        else:
-            print(f"Изменение названия отменено: '{self._title}' -> '{value}'")
-
-    @property
-    def price(self) -> float:
-        return self._price
-
-    @price.setter
-    def price(self, value: float) -> None:
-        changing_args = PropertyChangingEventArgs("price", self._price, value)
-        self.property_changing.invoke(self, changing_args)
-
-        if changing_args.can_change:
-            old_value = self._price
-            self._price = value
-            self.property_changed.invoke(self, PropertyChangedEventArgs("price"))
-            print(f"Цена изменена: {old_value:.2f} -> {self._price:.2f}")
-        else:
-            print(f"Изменение цены отменено: {self._price:.2f} -> {value:.2f}")
-
-    @property
-    def quantity(self) -> int:
-        return self._quantity
-
-    @quantity.setter
-    def quantity(self, value: int) -> None:
-        changing_args = PropertyChangingEventArgs("quantity", self._quantity, value)
-        self.property_changing.invoke(self, changing_args)
-
-        if changing_args.can_change:
-            old_value = self._quantity
-            self._quantity = value
-            self.property_changed.invoke(self, PropertyChangedEventArgs("quantity"))
-            print(f"Количество изменено: {old_value} -> {self._quantity}")
-        else:
-            print(f"Изменение количества отменено: {self._quantity} -> {value}")
+        # Событие изменения свойств (обе фазы)
+        self.property_event = PropertyEvent()
+        # Строковое представление, сбрасывается при изменении свойства
+        self._str_cache = None
 
     def __str__(self):
-        return f"Product(title='{self.title}', price={self.price:.2f}, quantity={self.quantity})"
+        if self._str_cache is None:
+            self._str_cache = f"Product(title='{self._title}', price={self._price:.2f}, quantity={self._quantity})"
+        return self._str_cache
 
 
 # Демонстрация работы системы
@@ -443,17 +647,17 @@ def demonstrate_complete_system():
 
     # Подписываем обработчики на события
     print("\nПОДПИСКА НА СОБЫТИЯ PERSON:")
-    person.property_changing += person_age_validator
-    person.property_changing += person_name_validator
-    person.property_changing += person_email_validator
-    person.property_changed += console_logger
+    person.property_event += person_age_validator
+    person.property_event += person_name_validator
+    person.property_event += person_email_validator
+    person.property_event += console_logger
 
     # Подписываем обработчики на события Product
     print("ПОДПИСКА НА СОБЫТИЯ PRODUCT:")
-    product.property_changing += product_quantity_validator
-    product.property_changing += product_price_validator
-    product.property_changing += product_title_validator
-    product.property_changed += console_logger
+    product.property_event += product_quantity_validator
+    product.property_event += product_price_validator
+    product.property_event += product_title_validator
+    product.property_event += console_logger
 
     print(f"Person: {person}")
     print(f"Product: {product}")
@@ -484,10 +688,10 @@ def demonstrate_complete_system():
 
     # Тест отписки от событий
     print("\nТЕСТ ОТПИСКИ ОТ СОБЫТИЙ:")
-    person.property_changing -= person_age_validator
-    person.property_changing -= person_name_validator
-    person.property_changing -= person_email_validator
-    person.property_changed -= console_logger
+    person.property_event -= person_age_validator
+    person.property_event -= person_name_validator
+    person.property_event -= person_email_validator
+    person.property_event -= console_logger
 
     print("Попытка изменения после отписки:")
     person.age = 35  # Должно измениться без валидации и логирования
@@ -1,15 +1,37 @@
+import atexit
 import json
-import pickle
+import struct
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Protocol, Sequence, TypeVar, Generic, Optional, List, Any
+from dataclasses import dataclass, field, fields, is_dataclass
+from operator import attrgetter, itemgetter
+from typing import Protocol, Sequence, TypeVar, Generic, Optional, List, Any, Container, Iterable
 from pathlib import Path
 import os
-import time
+
+try:
+    import orjson  # Быстрый JSON-кодировщик, если установлен
+except ImportError:
+    orjson = None
+
+
+def _dump_json(data: Any, pretty: bool = False) -> bytes:
+    """Сериализовать данные в JSON (UTF-8): компактно или с отступом 2 пробела при pretty"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _load_json(raw: bytes) -> Any:
+    """Разобрать JSON из байтов (ошибка разбора - json.JSONDecodeError)"""
+    if orjson is not None:
+        return orjson.loads(raw)  # orjson.JSONDecodeError наследует json.JSONDecodeError
+    return json.loads(raw)
 
 
 # 1. Класс User
-@dataclass(order=True)  # order=True позволяет сортировать по полю name
+@dataclass(order=True, slots=True)  # order=True позволяет сортировать по полю name, slots - без __dict__
 class User:
     """Класс пользователя системы"""
     id: int = field(compare=False)
@@ -25,6 +47,27 @@ class User:
         address_str = f", address='{self.address}'" if self.address else ""
         return f"User(id={self.id}, name='{self.name}', login='{self.login}'{email_str}{address_str})"
 
+    @classmethod
+    def _from_dict_fast(cls, item: dict) -> 'User':
+        """Создать пользователя из записи хранилища без разбора аргументов __init__"""
+        user = object.__new__(cls)
+        user.id = item['id']
+        user.name = item['name']
+        user.login = item['login']
+        user.password = item['password']
+        user.email = item.get('email')
+        user.address = item.get('address')
+        return user
+
+
+# Поля сортировки пользователей - те же, что сравнивает order=True (name, login, ...)
+_USER_ORDER_FIELDS = tuple(f.name for f in fields(User) if f.compare)
+
+
+def _user_record_order_key(record: dict) -> tuple:
+    """Ключ сортировки записи хранилища в порядке order=True класса User"""
+    return tuple(record.get(name) for name in _USER_ORDER_FIELDS)
+
 
 T = TypeVar('T')
 
@@ -71,51 +114,154 @@ class UserRepositoryProtocol(DataRepositoryProtocol[User]):
 
 # 3. Реализация DataRepository с JSON
 class JsonDataRepository(Generic[T]):
-    """Репозиторий для хранения данных в JSON файле"""
-    def __init__(self, filename: str, data_class: type, auto_sort: bool = False, sort_key: Optional[callable] = None):
+    """Репозиторий для хранения данных в JSON файле.
+    Данные держатся в памяти; изменения записываются в файл пачкой по batch_size,
+    при вызове flush(), выходе из блока with или завершении программы"""
+    _index_keys = ('id',)  # Поля записей, по которым строятся индексы
+
+    def __init__(self, filename: str, data_class: type, auto_sort: bool = False, sort_key: Optional[callable] = None,
+                 batch_size: int = 32, pretty: bool = False, record_sort_key: Optional[callable] = None):
         self.filename = filename
         self.data_class = data_class
         self.auto_sort = auto_sort
         self.sort_key = sort_key
+        # Тот же ключ сортировки, но для записей-словарей: файл сортируется без создания объектов
+        self.record_sort_key = record_sort_key
+        self.batch_size = batch_size
+        self.pretty = pretty  # Запись JSON с отступами (для просмотра файла человеком)
+        # Имена полей dataclass вычисляются один раз для _object_to_dict
+        self._fields = tuple(f.name for f in fields(data_class)) if is_dataclass(data_class) else None
+        # Создание объекта из записи: быстрый конструктор, если класс его объявляет
+        if '_from_dict_fast' in vars(data_class):
+            self._from_dict = data_class._from_dict_fast
+        else:
+            self._from_dict = lambda item: data_class(**item)
+        # Данные файла в памяти; заполняются при загрузке, чтение идет только отсюда
+        self._cache: Optional[List[dict]] = None
+        self._dirty = False  # Есть незаписанные изменения
+        self._pending = 0  # Число незаписанных изменений
+        self._indexes = {}  # Поле -> {значение: позиция записи в _cache}
+        self._duplicates = {}  # Поле -> значения, которые есть более чем у одной записи
+        self._max_id = 0  # Наибольший выданный ID; при удалении не уменьшается
         self._ensure_file_exists()
         self._validate_and_fix_data_on_load()
+        atexit.register(self.flush)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+    def flush(self) -> None:
+        """Записать накопленные изменения в файл"""
+        if self._dirty:
+            self._write_data(self._cache)
+            self._dirty = False
+            self._pending = 0
+
+    def _commit(self, data: List[dict]) -> None:
+        """Принять измененные данные; файл перезаписывается раз в batch_size изменений"""
+        self._cache = data
+        self._dirty = True
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
 
     def _validate_and_fix_data_on_load(self) -> None:
         """Проверить и исправить данные при загрузке репозитория"""
         data = self._read_raw_data()  # Читаем без автоматического исправления
         fixed_data = self._fix_duplicate_ids(data)
 
-        # Если данные изменились - сохраняем исправленные
-        if fixed_data != data:
+        # Если данные изменились (возвращен новый список) - сохраняем исправленные
+        if fixed_data is not data:
             self._write_data(fixed_data)
             print(f" Файл {self.filename} автоматически исправлен (дубликаты ID)")
+        self._cache = fixed_data
+        self._reindex()
+        self._max_id = max(self._indexes['id'], default=0)
+
+    def _reindex(self) -> None:
+        """Перестроить индексы по данным в памяти"""
+        self._indexes = {key: {} for key in self._index_keys}
+        self._duplicates = {key: set() for key in self._index_keys}
+        for position, record in enumerate(self._cache):
+            self._index_record(position, record)
+
+    def _index_record(self, position: int, record: dict) -> None:
+        """Добавить запись в индексы (при совпадении значений побеждает первая запись)"""
+        for key, index in self._indexes.items():
+            value = record.get(key)
+            if index.setdefault(value, position) != position:
+                self._duplicates[key].add(value)
+
+    def _unindex_record(self, position: int, record: dict) -> None:
+        """Убрать из индексов значения записи, указывающие на position"""
+        for key, index in self._indexes.items():
+            value = record.get(key)
+            if index.get(value) == position:
+                del index[value]
+
+    def _restore_index_values(self, data: List[dict], record: dict) -> None:
+        """Вернуть в индексы значения удаленной записи, оставшиеся у других записей"""
+        for key, index in self._indexes.items():
+            value = record.get(key)
+            duplicates = self._duplicates[key]
+            if value in index or value not in duplicates:
+                continue
+            # Редкий случай - значение повторялось: ищем первую запись с ним
+            positions = [i for i, other in enumerate(data) if other.get(key) == value]
+            if positions:
+                index[value] = positions[0]
+            if len(positions) < 2:
+                duplicates.discard(value)
+
+    def _find(self, key: str, value: Any) -> Optional[int]:
+        """Позиция записи с полем key == value или None"""
+        return self._indexes[key].get(value)
+
+    def _replace_record(self, data: List[dict], position: int, record: dict) -> None:
+        """Заменить запись; индексы перестраиваются, только если изменились индексируемые поля"""
+        old_record = data[position]
+        data[position] = record
+        if any(old_record.get(key) != record.get(key) for key in self._index_keys):
+            self._reindex()
 
     def _write_data(self, data: List[dict]) -> None:
         """Записать данные в файл с возможной сортировкой"""
         # Если задана функция сортировки
-        if self.sort_key:
+        if self.record_sort_key:
+            data = sorted(data, key=self.record_sort_key)
+        elif self.sort_key:
             # Преобразуем в объекты, сортируем, обратно в словари
-            items = [self.data_class(**item) for item in data]
+            items = [self._from_dict(item) for item in data]
             sorted_items = sorted(items, key=self.sort_key)
             data = [self._object_to_dict(item) for item in sorted_items]
 
+        # Пишем во временный файл рядом и атомарно подменяем им основной:
+        # при сбое во время записи старый файл останется целым
+        tmp_filename = f"{self.filename}.tmp"
         try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(tmp_filename, 'wb') as f:
+                f.write(_dump_json(data, self.pretty))
+                f.flush()
+                os.fsync(f.fileno())  # Один раз на пачку изменений (см. flush)
+            os.replace(tmp_filename, self.filename)
         except FileNotFoundError:
             print("ошибка записи в файл")
 
     def _read_raw_data(self) -> List[dict]:
         """Прочитать данные из файла без автоматического исправления"""
         try:
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _load_json(Path(self.filename).read_bytes())
         except (json.JSONDecodeError, FileNotFoundError):
             return []
 
     def _read_data(self) -> List[dict]:
-        """Прочитать данные из файла"""
-        return self._read_raw_data()  # Теперь исправление только при загрузке
+        """Данные репозитория (файл читается один раз, дальше - из памяти)"""
+        if self._cache is None:
+            self._cache = self._read_raw_data()
+        return self._cache
 
     @staticmethod
     def _fix_duplicate_ids(data: List[dict]) -> List[dict]:
@@ -123,6 +269,16 @@ class JsonDataRepository(Generic[T]):
         if not data:
             return data
 
+        # Быстрый проход без копирования: все ID положительные и уникальные - исправлять нечего
+        seen_ids = set()
+        for item in data:
+            item_id = item.get('id')
+            if item_id is None or item_id <= 0 or item_id in seen_ids:
+                break
+            seen_ids.add(item_id)
+        else:
+            return data
+
         seen_ids = set()
         fixed_data = []
 
@@ -157,8 +313,8 @@ class JsonDataRepository(Generic[T]):
     def _ensure_file_exists(self) -> None:
         """Создать файл если он не существует"""
         if not Path(self.filename).exists():
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump([], f)
+            with open(self.filename, 'wb') as f:
+                f.write(_dump_json([]))
 
     # def _read_data(self) -> List[dict]:
     #     """Прочитать данные из файла"""
@@ -175,48 +331,57 @@ class JsonDataRepository(Generic[T]):
 
     def get_all(self) -> Sequence[T]:
         """Получить все записи"""
-        data = self._read_data()
-        return [self.data_class(**item) for item in data]
+        from_dict = self._from_dict
+        return [from_dict(item) for item in self._cache]
 
     def get_by_id(self, id: int) -> Optional[T]:
         """Получить запись по ID"""
-        data = self._read_data()
-        for item in data:
-            if item.get('id') == id:
-                return self.data_class(**item)
-        return None
+        position = self._find('id', id)
+        if position is None:
+            return None
+        return self._from_dict(self._cache[position])
 
     def add(self, item: T) -> None:
         """Добавить новую запись"""
         data = self._read_data()
+        self._append(data, item)
+        self._commit(data)
 
-        # Проверяем уникальность ID
-        existing_ids = {d.get('id') for d in data}
-
-        if item.id in existing_ids:
-            # Находим следующий свободный ID
-            next_id = max(existing_ids, default=0) + 1
+    def add_many(self, items: Iterable[T]) -> None:
+        """Добавить несколько записей одной пачкой и сразу записать файл"""
+        data = self._read_data()
+        for item in items:
+            self._append(data, item)
+        self._commit(data)
+        self.flush()
+
+    def _append(self, data: List[dict], item: T) -> None:
+        """Добавить запись в данные и индексы (ID меняется, если уже занят)"""
+        # Проверяем уникальность ID; следующий свободный ID - после наибольшего выданного
+        if item.id is None or item.id <= 0:
+            # Без ID (как и при загрузке) - назначаем следующий
+            item.id = self._max_id + 1
+        elif item.id in self._indexes['id']:
+            next_id = self._max_id + 1
             print(f"  ID {item.id} уже существует. Назначаем ID {next_id}")
             item.id = next_id
+        if item.id > self._max_id:
+            self._max_id = item.id
 
         # Преобразуем объект в словарь
         item_dict = self._object_to_dict(item)
         data.append(item_dict)
-        self._write_data(data)
+        self._index_record(len(data) - 1, item_dict)
 
     def update(self, item: T) -> None:
         """Обновить существующую запись"""
         data = self._read_data()
-        updated = False
+        position = self._find('id', item.id)
 
-        for i, record in enumerate(data):
-            if record.get('id') == item.id:
-                data[i] = self._object_to_dict(item)
-                updated = True
-                print(f"Обновлена запись с ID {item.id}")
-                break
-
-        if not updated:
+        if position is not None:
+            self._replace_record(data, position, self._object_to_dict(item))
+            print(f"Обновлена запись с ID {item.id}")
+        else:
             # 2. Если не нашли по ID - НЕ СОЗДАВАЕМ НОВУЮ!
             # Вместо этого ищем по другим критериям или выбрасываем ошибку
             print(f"  Запись с ID {item.id} не найдена")
@@ -231,21 +396,32 @@ class JsonDataRepository(Generic[T]):
             #     item.id = next_id
             # data.append(self._object_to_dict(item))
 
-        self._write_data(data)
+        self._commit(data)
 
     def delete(self, item: T) -> None:
         """Удалить запись"""
         data = self._read_data()
-        new_data = [record for record in data if record.get('id') != item.id]
+        position = self._find('id', item.id)
 
-        if len(new_data) == len(data):
+        if position is None:
             raise ValueError(f"Запись с ID {item.id} не найдена")
 
-        self._write_data(new_data)
+        # Последняя запись переносится на место удаленной - список не сдвигается и не копируется
+        removed = data[position]
+        last = data.pop()
+        self._unindex_record(position, removed)
+        if position < len(data):
+            data[position] = last
+            self._unindex_record(len(data), last)
+            self._index_record(position, last)
+        self._restore_index_values(data, removed)
 
-    @staticmethod
-    def _object_to_dict(obj: Any) -> dict:
+        self._commit(data)
+
+    def _object_to_dict(self, obj: Any) -> dict:
         """Преобразовать объект в словарь"""
+        if self._fields is not None and type(obj) is self.data_class:
+            return {name: getattr(obj, name) for name in self._fields}
         if hasattr(obj, '__dict__'):
             return {k: v for k, v in obj.__dict__.items() if not k.startswith('_')}
         elif hasattr(obj, '_asdict'):
@@ -256,53 +432,56 @@ class JsonDataRepository(Generic[T]):
 # 4. Реализация UserRepository
 class UserRepository(JsonDataRepository[User], UserRepositoryProtocol):
     """Репозиторий пользователей на основе JSON хранилища"""
+    _index_keys = ('id', 'login')
+
+    def __init__(self, filename: str = "users_demo.json", batch_size: int = 32, pretty: bool = False):
+        # Отсортированные записи для get_all, сбрасываются при изменениях
+        self._users_cache: Optional[List[dict]] = None
+        super().__init__(filename, User, auto_sort=True, sort_key=attrgetter('name'),
+                         batch_size=batch_size, pretty=pretty, record_sort_key=itemgetter('name'))
 
-    def __init__(self, filename: str = "users_demo.json"):
-        super().__init__(filename, User, auto_sort=True, sort_key=lambda u: u.name)
+    def _commit(self, data: List[dict]) -> None:
+        super()._commit(data)
+        self._users_cache = None
 
     def get_by_login(self, login: str) -> Optional[User]:
         """Получить пользователя по логину"""
-        data = self._read_data()
-        for item in data:
-            if item.get('login') == login:
-                return User(**item)
-        return None
+        position = self._find('login', login)
+        if position is None:
+            return None
+        return self._from_dict(self._cache[position])
 
     def get_all(self) -> Sequence[User]:
         """Получить всех пользователей (всегда отсортировано по имени)"""
-        users = super().get_all()  # Получаем базовый список
-        return sorted(users)  # Сортируем по name
+        if self._users_cache is None:
+            # Кэшируется порядок записей, а не объекты: пользователи создаются заново
+            self._users_cache = sorted(self._cache, key=_user_record_order_key)  # Сортируем по name
+        from_dict = self._from_dict
+        return [from_dict(record) for record in self._users_cache]
 
     def update(self, item: User) -> None:
         """Обновить пользователя с поиском по ID или логину"""
         data = self._read_data()
-        updated = False
 
         # 1. Ищем по ID (основной способ)
-        for i, record in enumerate(data):
-            if record.get('id') == item.id:
-                data[i] = self._object_to_dict(item)
-                updated = True
-                print(f"Обновлен пользователь ID {item.id}: {item.name}")
-                break
-
-        # 2. Если не нашли по ID, ищем по логину
-        if not updated:
-            for i, record in enumerate(data):
-                if record.get('login') == item.login:
-                    # Нашли по логину, но ID другой - меняем ID на найденный
-                    old_id = record.get('id')
-                    print(f"  Обновление по логину: {item.login} (ID был {item.id}, меняем на {old_id})")
-                    item.id = old_id  # Используем ID из файла
-                    data[i] = self._object_to_dict(item)
-                    updated = True
-                    break
-
-        if not updated:
+        position = self._find('id', item.id)
+        if position is not None:
+            print(f"Обновлен пользователь ID {item.id}: {item.name}")
+        else:
+            # 2. Если не нашли по ID, ищем по логину
+            position = self._find('login', item.login)
+            if position is not None:
+                # Нашли по логину, но ID другой - меняем ID на найденный
+                old_id = data[position]['id']
+                print(f"  Обновление по логину: {item.login} (ID был {item.id}, меняем на {old_id})")
+                item.id = old_id  # Используем ID из файла
+
+        if position is None:
             print(f"  Пользователь не найден (ID: {item.id}, login: {item.login})")
             return  # Не создаем нового!
 
-        self._write_data(data)
+        self._replace_record(data, position, self._object_to_dict(item))
+        self._commit(data)
 
 
 # 5. Протокол сервиса авторизации
@@ -335,6 +514,8 @@ class AuthServiceProtocol(Protocol):
 # 6. Реализация сервиса авторизации
 class FileAuthService(AuthServiceProtocol):
     """Сервис авторизации с хранением сессии в файле"""
+    # Файл сессии - ID пользователя, 8 байт little-endian (0 - нет пользователя)
+    _SESSION_FORMAT = struct.Struct('<q')
 
     def __init__(self, user_repository: UserRepositoryProtocol, session_file: str = "session.dat"):
         self.user_repository = user_repository
@@ -345,25 +526,29 @@ class FileAuthService(AuthServiceProtocol):
     def _load_session(self) -> None:
         """Загрузить сессию из файла (автоматическая авторизация)"""
         try:
-            if Path(self.session_file).exists():
-                with open(self.session_file, 'rb') as f:
-                    session_data = pickle.load(f)
-                    user_id = session_data.get('user_id')
-
-                    if user_id:
-                        user = self.user_repository.get_by_id(user_id)
-                        if user:
-                            self._current_user = user
-                            print(f"Автоматически авторизован пользователь: {user.name}")
+            session_path = Path(self.session_file)
+            if session_path.exists():
+                raw = session_path.read_bytes()
+                if len(raw) != self._SESSION_FORMAT.size:
+                    # Файл другого формата (например, старый pickle) - сессии нет
+                    session_path.unlink()
+                    return
+                (user_id,) = self._SESSION_FORMAT.unpack(raw)
+
+                if user_id:
+                    user = self.user_repository.get_by_id(user_id)
+                    if user:
+                        self._current_user = user
+                        print(f"Автоматически авторизован пользователь: {user.name}")
         except Exception as e:
             print(f"Ошибка загрузки сессии: {e}")
 
     def _save_session(self) -> None:
         """Сохранить сессию в файл"""
         try:
-            session_data = {'user_id': self._current_user.id if self._current_user else None}
+            user_id = self._current_user.id if self._current_user else 0
             with open(self.session_file, 'wb') as f:
-                pickle.dump(session_data, f)
+                f.write(self._SESSION_FORMAT.pack(user_id))
         except Exception as e:
             print(f"Ошибка сохранения сессии: {e}")
 
@@ -408,26 +593,58 @@ class FileAuthService(AuthServiceProtocol):
         self._clear_session()
 
 
+# Неизменяемые тексты консоли собираются один раз и выводятся одним print
+_SEPARATOR = "=" * 40
+
+_ADD_USER_HEADER = "\n".join(["\n" + _SEPARATOR, "ДОБАВЛЕНИЕ НОВОГО ПОЛЬЗОВАТЕЛЯ", _SEPARATOR])
+
+_REGISTER_USER_HEADER = "\n".join(["\n" + _SEPARATOR, "РЕГИСТРАЦИЯ НОВОГО ПОЛЬЗОВАТЕЛЯ", _SEPARATOR])
+
+_MENU_TEXT = "\n".join([
+    "\n" + _SEPARATOR,
+    "МЕНЮ СИСТЕМЫ АВТОРИЗАЦИИ",
+    _SEPARATOR,
+    "1. Добавить нового пользователя",
+    "2. Показать всех пользователей",
+    "3. Найти пользователя по ID",
+    "4. Найти пользователя по логину",
+    "5. Авторизоваться",
+    "6. Выйти чтобы сменить пользователя",
+    "7. Проверить текущую авторизацию",
+    "8. Редактировать пользователя",
+    "9. Удалить пользователя",
+    "0. Завершение программы",
+    _SEPARATOR,
+])
+
+# Поля, запрашиваемые при добавлении пользователя: (название, обязательное)
+_USER_INPUT_FIELDS = (
+    ("имя", True),
+    ("логин", True),
+    ("пароль", True),
+    ("email", False),
+    ("адрес", False),
+)
+
+# Название поля в консоли -> атрибут User
+_FIELD_MAP = {
+    "имя": "name",
+    "логин": "login",
+    "пароль": "password",
+    "email": "email",
+    "адрес": "address",
+}
+
+
 # для добавления пользователя с консоли, Сервис для ввода/вывода
 class ConsoleService:
     @staticmethod
     def input_user() -> Optional[User]:
         """Ввод данных пользователя с консоли"""
-        print("\n" + "=" * 40)
-        print("ДОБАВЛЕНИЕ НОВОГО ПОЛЬЗОВАТЕЛЯ")
-        print("=" * 40)
-
-        # Ввод обязательных полей
-        fields = [
-            ("имя", True),
-            ("логин", True),
-            ("пароль", True),
-            ("email", False),
-            ("адрес", False),
-        ]
+        print(_ADD_USER_HEADER)
 
         data = {}
-        for field_name, required in fields:
+        for field_name, required in _USER_INPUT_FIELDS:
             while True:
                 prompt = f"Введите {field_name}: "
                 if not required:
@@ -439,17 +656,9 @@ class ConsoleService:
                     print(f"{field_name} не может быть пустым!")
                     continue
 
-                # Преобразуем имя поля для объекта User
-                field_map = {
-                    "имя": "name",
-                    "логин": "login",
-                    "пароль": "password",
-                    "email": "email",
-                    "адрес": "address"
-                }
-
                 if value or required:
-                    data[field_map[field_name]] = value if value else None
+                    # Преобразуем имя поля для объекта User
+                    data[_FIELD_MAP[field_name]] = value if value else None
                 break
 
         # Создаем пользователя
@@ -465,20 +674,7 @@ class ConsoleService:
     @staticmethod
     def show_menu() -> str:
         """Показывает меню и возвращает выбор пользователя"""
-        print("\n" + "=" * 40)
-        print("МЕНЮ СИСТЕМЫ АВТОРИЗАЦИИ")
-        print("=" * 40)
-        print("1. Добавить нового пользователя")
-        print("2. Показать всех пользователей")
-        print("3. Найти пользователя по ID")
-        print("4. Найти пользователя по логину")
-        print("5. Авторизоваться")
-        print("6. Выйти чтобы сменить пользователя")
-        print("7. Проверить текущую авторизацию")
-        print("8. Редактировать пользователя")
-        print("9. Удалить пользователя")
-        print("0. Завершение программы")
-        print("=" * 40)
+        print(_MENU_TEXT)
 
         return input("Выберите действие: ").strip()
 
@@ -508,7 +704,7 @@ class UserValidator:
         return '@' in email and '.' in email.split('@')[-1]
 
     @staticmethod
-    def validate_login(login: str, existing_logins: List[str]) -> tuple[bool, str]:
+    def validate_login(login: str, existing_logins: Container[str]) -> tuple[bool, str]:
         if not login:
             return False, "Логин не может быть пустым"
         if len(login) < 3:
@@ -522,12 +718,10 @@ class UserValidator:
 class EnhancedConsoleService(ConsoleService):
     @staticmethod
     def input_user_with_validation(user_repo: UserRepository) -> Optional[User]:
-        print("\n" + "=" * 40)
-        print("РЕГИСТРАЦИЯ НОВОГО ПОЛЬЗОВАТЕЛЯ")
-        print("=" * 40)
+        print(_REGISTER_USER_HEADER)
 
-        # Получаем существующие логины для проверки
-        existing_logins = [user.login for user in user_repo.get_all()]
+        # Получаем существующие логины для проверки (множество - проверка за O(1))
+        existing_logins = {user.login for user in user_repo.get_all()}
 
         # Ввод с валидацией
         name = input("Имя: ").strip()
@@ -593,12 +787,12 @@ def first_demonstrate_auth_system():
         User(id=3, name="Алексей Иванов", login="alex", password="password123"),
     ]
 
-    for user in users:
-        try:
-            user_repo.add(user)
+    try:
+        user_repo.add_many(users)
+        for user in users:
             print(f"   Добавлен: {user.name}")
-        except ValueError as e:
-            print(f"   Ошибка: {e}")
+    except ValueError as e:
+        print(f"   Ошибка: {e}")
 
     # 2. Показать всех пользователей (сортировка по name)
     print("\n2. ВСЕ ПОЛЬЗОВАТЕЛИ:")
@@ -671,8 +865,25 @@ def first_demonstrate_auth_system():
     if found_user:
         print(f"   Найден: {found_user}")
 
+    # 10. Удаление при повторяющихся логинах (меню не проверяет уникальность логина)
+    print("\n10. УДАЛЕНИЕ ПРИ ПОВТОРЯЮЩИХСЯ ЛОГИНАХ:")
+    dup_file = Path("users_dup_demo.json")
+    if dup_file.exists():
+        dup_file.unlink()
+    dup_repo = UserRepository(str(dup_file))
+    dup_repo.add_many([User(id=1, name="Первый", login="same", password="1"),
+                       User(id=2, name="Второй", login="same", password="2"),
+                       User(id=3, name="Третий", login="other", password="3")])
+    dup_repo.delete(dup_repo.get_by_id(1))
+    remaining = dup_repo.get_by_login("same")
+    print(f"   После удаления первого найден: {remaining}")
+    print(f"   Проверка: {'ПРОЙДЕНА' if remaining is not None and remaining.id == 2 else 'НЕ ПРОЙДЕНА'}")
+    dup_repo.flush()
+    dup_file.unlink()
+
     # Очистка (выход из системы)
     new_auth_service.sign_out()
+    user_repo.flush()
 
     print("\n" + "=" * 60)
     print("ДЕМОНСТРАЦИЯ ЗАВЕРШЕНА!")
@@ -686,7 +897,6 @@ def main():
 
     # Главный цикл программы
     while True:
-        time.sleep(2)
         choice = ConsoleService.show_menu()
 
         if choice == "1":  # Добавить пользователя
@@ -714,7 +924,7 @@ def main():
             users = user_repo.get_all()
             if users:
                 print(f"\nВсего пользователей: {len(users)}")
-                for user in sorted(users, key=lambda u: u.name):
+                for user in sorted(users, key=attrgetter('name')):
                     ConsoleService.print_user(user)
             else:
                 print("Нет пользователей в системе")
@@ -788,6 +998,7 @@ def main():
 
         elif choice == "0":  # Выход без сохранения
             print("Выход без сохранения")
+            user_repo.flush()  # Записываем накопленные изменения
             break
 
         else:
@@ -803,9 +1014,8 @@ def should_show_demo(file_path: str = "users_demo.json") -> bool:
 
     # Или проверяем содержимое JSON
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            return len(data.get("users", [])) == 0
+        data = _load_json(path.read_bytes())
+        return len(data.get("users", [])) == 0
     except Exception as e:
         print(f"Неизвестная ошибка при чтении {file_path}: {e} - показываем демо")
         return True